@@ -477,6 +477,109 @@ def test_request_logger_log_outputs_integration():
         assert output_call[1] == "test-integration"
 
 
+def test_request_logger_log_inputs_batch():
+    """Test the batched input logging functionality."""
+    mock_logger = MagicMock()
+
+    with patch("vllm.entrypoints.logger.logger", mock_logger):
+        request_logger = RequestLogger(max_log_len=None)
+
+        request_logger.log_inputs_batch(
+            request_id="test-batch",
+            num_prompts=3,
+            prompt="First prompt",
+            prompt_token_ids=[1, 2, 3],
+            prompt_embeds=None,
+            params=None,
+            lora_request=None,
+        )
+
+        mock_logger.info.assert_called_once()
+        call_args = mock_logger.info.call_args.args
+        assert "Received request %s (%d prompts)" in call_args[0]
+        assert call_args[1] == "test-batch"
+        assert call_args[2] == 3
+        assert call_args[3] is None
+        assert call_args[4] is None
+
+        # The first prompt is previewed in the debug record
+        mock_logger.debug.assert_called_once()
+        debug_args = mock_logger.debug.call_args.args
+        assert debug_args[1] == "test-batch"
+        assert debug_args[2] == 3
+        assert debug_args[3] == "First prompt"
+        assert debug_args[4] == [1, 2, 3]
+
+
+def test_request_logger_log_inputs_batch_with_truncation():
+    """Test log_inputs_batch truncates the preview to max_log_len."""
+    mock_logger = MagicMock()
+
+    with patch("vllm.entrypoints.logger.logger", mock_logger):
+        # Set max_log_len to 10
+        request_logger = RequestLogger(max_log_len=10)
+
+        long_prompt = "This is a very long prompt that should be truncated"
+        long_token_ids = list(range(20))  # 20 tokens
+
+        request_logger.log_inputs_batch(
+            request_id="test-batch-truncate",
+            num_prompts=5,
+            prompt=long_prompt,
+            prompt_token_ids=long_token_ids,
+            prompt_embeds=None,
+            params=None,
+            lora_request=None,
+        )
+
+        # The prompt count is logged in full regardless of truncation
+        mock_logger.info.assert_called_once()
+        call_args = mock_logger.info.call_args.args
+        assert call_args[2] == 5
+
+        # Check that the previewed prompt was truncated to 10 characters
+        mock_logger.debug.assert_called_once()
+        debug_args = mock_logger.debug.call_args.args
+        logged_prompt = debug_args[3]
+        assert logged_prompt == "This is a "
+        assert len(logged_prompt) == 10
+
+        # Check that the previewed token IDs were truncated to 10 tokens
+        logged_token_ids = debug_args[4]
+        assert logged_token_ids == list(range(10))
+        assert len(logged_token_ids) == 10
+
+
+def test_request_logger_log_inputs_batch_none_values():
+    """Test log_inputs_batch handles None values correctly."""
+    mock_logger = MagicMock()
+
+    with patch("vllm.entrypoints.logger.logger", mock_logger):
+        request_logger = RequestLogger(max_log_len=10)
+
+        request_logger.log_inputs_batch(
+            request_id="test-batch-none",
+            num_prompts=1,
+            prompt=None,
+            prompt_token_ids=None,
+            prompt_embeds=None,
+            params=None,
+            lora_request=None,
+        )
+
+        mock_logger.info.assert_called_once()
+        call_args = mock_logger.info.call_args.args
+        assert "Received request %s (%d prompts)" in call_args[0]
+        assert call_args[1] == "test-batch-none"
+        assert call_args[2] == 1
+
+        mock_logger.debug.assert_called_once()
+        debug_args = mock_logger.debug.call_args.args
+        assert debug_args[3] is None
+        assert debug_args[4] is None
+        assert debug_args[5] is None
+
+
 def test_streaming_complete_logs_full_text_content():
     """Test that streaming complete logging includes
     full accumulated text, not just token count."""
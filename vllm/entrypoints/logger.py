@@ -53,6 +53,50 @@ class RequestLogger:
             lora_request,
         )
 
+    def log_inputs_batch(
+        self,
+        request_id: str,
+        num_prompts: int,
+        prompt: str | None,
+        prompt_token_ids: list[int] | None,
+        prompt_embeds: torch.Tensor | None,
+        params: SamplingParams | PoolingParams | BeamSearchParams | None,
+        lora_request: LoRARequest | None,
+    ) -> None:
+        """Log a batch of prompts as a single record.
+
+        Only the first prompt is previewed so that large batches emit one
+        log line per API call rather than one per prompt.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            max_log_len = self.max_log_len
+            if max_log_len is not None:
+                if prompt is not None:
+                    prompt = prompt[:max_log_len]
+
+                if prompt_token_ids is not None:
+                    prompt_token_ids = prompt_token_ids[:max_log_len]
+
+            logger.debug(
+                "Request %s details: num_prompts: %d, "
+                "first prompt: %r, "
+                "first prompt_token_ids: %s, "
+                "first prompt_embeds shape: %s.",
+                request_id,
+                num_prompts,
+                prompt,
+                prompt_token_ids,
+                prompt_embeds.shape if prompt_embeds is not None else None,
+            )
+
+        logger.info(
+            "Received request %s (%d prompts): params: %s, lora_request: %s.",
+            request_id,
+            num_prompts,
+            params,
+            lora_request,
+        )
+
     def log_outputs(
         self,
         request_id: str,
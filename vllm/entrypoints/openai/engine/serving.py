@@ -767,8 +767,8 @@ class OpenAIServing:
         request: AnyRequest,
         supports_default_mm_loras: bool = False,
     ) -> LoRARequest | None:
-        if request.model in self.models.lora_requests:
-            return self.models.lora_requests[request.model]
+        if (lora_request := self.models.lora_requests.get(request.model)) is not None:
+            return lora_request
 
         # Currently only support default modality specific loras
         # if we have exactly one lora matched on the request.
@@ -1155,6 +1155,28 @@ class OpenAIServing:
             lora_request=lora_request,
         )
 
+    def _log_inputs_batch(
+        self,
+        request_id: str,
+        inputs: Sequence[PromptType | ProcessorInputs],
+        params: SamplingParams | PoolingParams | BeamSearchParams | None,
+        lora_request: LoRARequest | None,
+    ) -> None:
+        if self.request_logger is None or not inputs:
+            return
+
+        components = self._extract_prompt_components(inputs[0])
+
+        self.request_logger.log_inputs_batch(
+            request_id,
+            len(inputs),
+            components.text,
+            components.token_ids,
+            components.embeds,
+            params=params,
+            lora_request=lora_request,
+        )
+
     async def _get_trace_headers(
         self,
         headers: Headers,
@@ -2,6 +2,8 @@
 # SPDX-FileCopyrightText: Copyright contributors to the vLLM project
 
 
+import importlib.util
+from functools import lru_cache
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
@@ -28,6 +30,19 @@ from vllm.logger import init_logger
 logger = init_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_json_response_cls():
+    if importlib.util.find_spec("orjson") is not None:
+        from fastapi.responses import ORJSONResponse
+
+        return ORJSONResponse
+    logger.warning_once(
+        "To make the tokenization APIs fast, please install orjson "
+        "by `pip install orjson`"
+    )
+    return JSONResponse
+
+
 def tokenization(request: Request) -> OpenAIServingTokenization:
     return request.app.state.openai_serving_tokenization
 
@@ -59,7 +74,7 @@ async def tokenize(request: TokenizeRequest, raw_request: Request):
             content=generator.model_dump(), status_code=generator.error.code
         )
     elif isinstance(generator, TokenizeResponse):
-        return JSONResponse(content=generator.model_dump())
+        return _get_json_response_cls()(content=generator.model_dump())
 
     assert_never(generator)
 
@@ -91,7 +106,7 @@ async def detokenize(request: DetokenizeRequest, raw_request: Request):
             content=generator.model_dump(), status_code=generator.error.code
         )
     elif isinstance(generator, DetokenizeResponse):
-        return JSONResponse(content=generator.model_dump())
+        return _get_json_response_cls()(content=generator.model_dump())
 
     assert_never(generator)
 
@@ -104,11 +119,10 @@ def attach_router(app: FastAPI):
         async def get_tokenizer_info(raw_request: Request):
             """Get comprehensive tokenizer information."""
             result = await tokenization(raw_request).get_tokenizer_info()
-            return JSONResponse(
-                content=result.model_dump(),
-                status_code=result.error.code
-                if isinstance(result, ErrorResponse)
-                else 200,
-            )
+            if isinstance(result, ErrorResponse):
+                return JSONResponse(
+                    content=result.model_dump(), status_code=result.error.code
+                )
+            return _get_json_response_cls()(content=result.model_dump())
 
     app.include_router(router)
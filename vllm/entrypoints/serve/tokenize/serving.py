@@ -1,6 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: Copyright contributors to the vLLM project
+import asyncio
+import json
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Final
 
 import jinja2
@@ -23,9 +27,25 @@ from vllm.entrypoints.serve.tokenize.protocol import (
 from vllm.inputs import TokensPrompt, token_inputs
 from vllm.logger import init_logger
 from vllm.tokenizers import TokenizerLike
+from vllm.utils.mistral import is_mistral_tokenizer
 
 logger = init_logger(__name__)
 
+_REQUEST_ID_PREFIX = "tokenize-"
+
+_SENTINEL = object()
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_tool_dicts(tools_json: tuple[str, ...]) -> list[dict[str, Any]]:
+    """Deserialize tool definitions, memoized on their canonical JSON.
+
+    Agentic workloads resend the same tool list across turns, so this
+    avoids rebuilding the dicts on every request. The cached dicts are
+    shared; the chat template path only reads them.
+    """
+    return [json.loads(tool_json) for tool_json in tools_json]
+
 
 class OpenAIServingTokenization(OpenAIServing):
     def __init__(
@@ -50,6 +70,24 @@ class OpenAIServingTokenization(OpenAIServing):
         self.chat_template_content_format: Final = chat_template_content_format
         self.trust_request_chat_template = trust_request_chat_template
 
+        # The serialized payload for /tokenizer_info only changes if the
+        # tokenizer object itself is replaced, so memoize it per tokenizer.
+        self._tokenizer_info: tuple[TokenizerLike, dict[str, Any]] | None = None
+
+        # Lazily-built id -> token table used for `return_token_strs`, also
+        # keyed on the tokenizer object.
+        self._id_to_token: tuple[TokenizerLike, list[str]] | None = None
+
+    def _get_request_id(self, raw_request: Request) -> str:
+        # Deriving the id may generate a UUID, so memoize it on the
+        # Starlette request state in case it is needed more than once.
+        request_id = getattr(raw_request.state, "tokenize_request_id", None)
+        if request_id is None:
+            request_id = _REQUEST_ID_PREFIX + self._base_request_id(raw_request)
+            raw_request.state.tokenize_request_id = request_id
+
+        return request_id
+
     async def create_tokenize(
         self,
         request: TokenizeRequest,
@@ -59,7 +97,7 @@ class OpenAIServingTokenization(OpenAIServing):
         if error_check_ret is not None:
             return error_check_ret
 
-        request_id = f"tokenize-{self._base_request_id(raw_request)}"
+        request_id = self._get_request_id(raw_request)
 
         try:
             lora_request = self._maybe_get_adapters(request)
@@ -68,7 +106,9 @@ class OpenAIServingTokenization(OpenAIServing):
                 tool_dicts = (
                     None
                     if request.tools is None
-                    else [tool.model_dump() for tool in request.tools]
+                    else _get_cached_tool_dicts(
+                        tuple(tool.model_dump_json() for tool in request.tools)
+                    )
                 )
                 error_check_ret = self._validate_chat_template(
                     request_chat_template=request.chat_template,
@@ -96,22 +136,36 @@ class OpenAIServingTokenization(OpenAIServing):
             logger.exception("Error in preprocessing prompt inputs")
             return self.create_error_response(f"{e} {e.__cause__}")
 
-        input_ids: list[int] = []
-        for engine_prompt in engine_prompts:
-            self._log_inputs(
-                request_id,
-                engine_prompt,
-                params=None,
-                lora_request=lora_request,
-            )
+        self._log_inputs_batch(
+            request_id,
+            engine_prompts,
+            params=None,
+            lora_request=lora_request,
+        )
 
-            if "prompt_token_ids" in engine_prompt:
-                input_ids.extend(engine_prompt["prompt_token_ids"])  # type: ignore[typeddict-item]
+        # Flatten in a single pass so CPython can size the result list once
+        # instead of repeatedly growing it via extend. Prompts almost always
+        # carry token ids here, so probe the key once with .get rather than
+        # paying a membership test plus a subscript per prompt.
+        input_ids: list[int] = list(
+            chain.from_iterable(
+                engine_prompt.get("prompt_token_ids") or ()
+                for engine_prompt in engine_prompts
+            )
+        )
 
-        token_strs = None
+        token_strs: list[str] | None = None
         if request.return_token_strs:
-            tokenizer = self.renderer.get_tokenizer()
-            token_strs = tokenizer.convert_ids_to_tokens(input_ids)
+            if input_ids:
+                tokenizer = self.renderer.get_tokenizer()
+                # Token string conversion iterates over every id in Python and
+                # can block the event loop for hundreds of milliseconds on long
+                # prompts, so run it in an executor to keep the loop responsive.
+                token_strs = await asyncio.get_running_loop().run_in_executor(
+                    None, self._convert_ids_to_tokens, tokenizer, input_ids
+                )
+            else:
+                token_strs = []
 
         return TokenizeResponse(
             tokens=input_ids,
@@ -120,6 +174,43 @@ class OpenAIServingTokenization(OpenAIServing):
             max_model_len=self.model_config.max_model_len,
         )
 
+    def _convert_ids_to_tokens(
+        self,
+        tokenizer: TokenizerLike,
+        input_ids: list[int],
+    ) -> list[str]:
+        """Convert ids to token strings via a per-tokenizer lookup table.
+
+        `convert_ids_to_tokens` performs a per-id dict lookup in Python, so
+        for large prompts it is much faster to convert the whole vocab once
+        and index into the resulting list.
+        """
+        cached = self._id_to_token
+        if cached is not None and cached[0] is tokenizer:
+            id_to_token = cached[1]
+        else:
+            all_ids = range(tokenizer.max_token_id + 1)
+            if tokenizer.is_fast and hasattr(tokenizer, "backend_tokenizer"):
+                # Query the Rust tokenizer directly, skipping the per-id
+                # Python wrapper inside convert_ids_to_tokens.
+                backend_id_to_token = tokenizer.backend_tokenizer.id_to_token
+                id_to_token = [backend_id_to_token(i) for i in all_ids]
+            else:
+                id_to_token = tokenizer.convert_ids_to_tokens(list(all_ids))
+            self._id_to_token = (tokenizer, id_to_token)
+
+        # Negative ids would silently index from the end of the table, so
+        # they must not take the fast path.
+        if min(input_ids, default=0) >= 0:
+            try:
+                return [id_to_token[i] for i in input_ids]
+            except IndexError:
+                pass
+
+        # Ids outside the vocab range; let the tokenizer handle them the
+        # same way it did before the table existed (typically by raising).
+        return tokenizer.convert_ids_to_tokens(input_ids)
+
     async def create_detokenize(
         self,
         request: DetokenizeRequest,
@@ -129,7 +220,7 @@ class OpenAIServingTokenization(OpenAIServing):
         if error_check_ret is not None:
             return error_check_ret
 
-        request_id = f"tokenize-{self._base_request_id(raw_request)}"
+        request_id = self._get_request_id(raw_request)
 
         lora_request = self._maybe_get_adapters(request)
 
@@ -154,8 +245,15 @@ class OpenAIServingTokenization(OpenAIServing):
         """Get comprehensive tokenizer information."""
         try:
             tokenizer = self.renderer.get_tokenizer()
-            info = TokenizerInfo(tokenizer, self.chat_template).to_dict()
-            return TokenizerInfoResponse(**info)
+            cached = self._tokenizer_info
+            if cached is not None and cached[0] is tokenizer:
+                info = cached[1]
+            else:
+                info = TokenizerInfo(tokenizer, self.chat_template).to_dict()
+                self._tokenizer_info = (tokenizer, info)
+            # The dict is built internally and already JSON-serializable,
+            # so skip per-field validation of the (potentially large) config.
+            return TokenizerInfoResponse.model_construct(**info)
         except Exception as e:
             return self.create_error_response(f"Failed to get tokenizer info: {str(e)}")
 
@@ -165,12 +263,23 @@ class TokenizerInfo:
     tokenizer: TokenizerLike
     chat_template: str | None
 
+    def __post_init__(self) -> None:
+        # Resolved once at construction rather than on every config build.
+        self._tokenizer_class = type(self.tokenizer).__name__
+
     def to_dict(self) -> dict[str, Any]:
         """Return the tokenizer configuration."""
         return self._get_tokenizer_config()
 
     def _get_tokenizer_config(self) -> dict[str, Any]:
         """Get tokenizer configuration directly from the tokenizer object."""
+        if is_mistral_tokenizer(self.tokenizer):
+            # MistralTokenizer has no HF-style init_kwargs to serialize.
+            config: dict[str, Any] = {"tokenizer_class": self._tokenizer_class}
+            if self.chat_template:
+                config["chat_template"] = self.chat_template
+            return config
+
         config = dict(getattr(self.tokenizer, "init_kwargs", None) or {})
 
         # Remove file path fields
@@ -178,18 +287,39 @@ class TokenizerInfo:
         config.pop("merges_file", None)
 
         config = self._make_json_serializable(config)
-        config["tokenizer_class"] = type(self.tokenizer).__name__
+        config["tokenizer_class"] = self._tokenizer_class
         if self.chat_template:
             config["chat_template"] = self.chat_template
         return config
 
     def _make_json_serializable(self, obj):
         """Convert any non-JSON-serializable objects to serializable format."""
-        if hasattr(obj, "content"):
-            return obj.content
-        elif isinstance(obj, dict):
-            return {k: self._make_json_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_json_serializable(item) for item in obj]
-        else:
+        # The AddedToken case comes first since tokenizer configs can hold
+        # thousands of them (added_tokens_decoder).
+        content = getattr(obj, "content", _SENTINEL)
+        if content is not _SENTINEL:
+            return content
+        if not isinstance(obj, (dict, list)):
             return obj
+
+        # Walk iteratively with an explicit stack to avoid per-node function
+        # call overhead. Each container is copied before being mutated so the
+        # tokenizer's own config stays untouched.
+        result = obj.copy()
+        stack: list[dict[Any, Any] | list[Any]] = [result]
+        while stack:
+            container = stack.pop()
+            items = (
+                container.items()
+                if isinstance(container, dict)
+                else enumerate(container)
+            )
+            for key, value in items:
+                content = getattr(value, "content", _SENTINEL)
+                if content is not _SENTINEL:
+                    container[key] = content  # type: ignore[index]
+                elif isinstance(value, (dict, list)):
+                    container[key] = value = value.copy()  # type: ignore[index]
+                    stack.append(value)
+
+        return result
@@ -30,7 +30,6 @@ from vllm.tokenizers import cached_get_tokenizer
 from vllm.tokenizers.hf import CachedHfTokenizer, HfTokenizer
 from vllm.transformers_utils.chat_templates import get_chat_template_fallback_path
 from vllm.transformers_utils.processor import cached_get_processor
-from vllm.utils.func_utils import supports_kw
 
 from .base import BaseRenderer
 from .inputs import DictPrompt
@@ -408,6 +407,20 @@ def _get_hf_base_chat_template_params() -> frozenset[str]:
     )
 
 
+@lru_cache(maxsize=32)
+def _get_apply_chat_template_params(tokenizer_cls: type) -> frozenset[str]:
+    # Inspecting the signature on every request is surprisingly costly, so
+    # resolve the explicit (non-variadic) parameters once per tokenizer class.
+    sig = inspect.signature(tokenizer_cls.apply_chat_template)
+
+    return frozenset(
+        p.name
+        for p in sig.parameters.values()
+        if p.kind
+        not in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL)
+    )
+
+
 def resolve_chat_template_kwargs(
     tokenizer: HfTokenizer,
     chat_template: str,
@@ -425,11 +438,9 @@ def resolve_chat_template_kwargs(
             f"{unexpected_in_kwargs}"
         )
 
-    fn_kw = {
-        k
-        for k in chat_template_kwargs
-        if supports_kw(tokenizer.apply_chat_template, k, allow_var_kwargs=False)
-    }
+    fn_kw = (
+        _get_apply_chat_template_params(type(tokenizer)) & chat_template_kwargs.keys()
+    )
     template_vars = _cached_resolve_chat_template_kwargs(chat_template)
 
     # Allow standard HF parameters even if tokenizer uses **kwargs to receive them